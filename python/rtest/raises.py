@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from types import TracebackType
+from typing import Callable
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a ``match`` pattern, reusing the result across ``raises`` blocks."""
+    return re.compile(pattern)
 
 
 class RaisesContext:
@@ -24,16 +32,36 @@ class RaisesContext:
         self.expected_exception = expected_exception
         self.match_expr = match
         self.value: BaseException | None = None
-
-        if self.match_expr is not None:
+        self._compiled: re.Pattern[str] | None = None
+        self._exc_single: type[BaseException] | None = (
+            None if isinstance(expected_exception, tuple) else expected_exception
+        )
+
+        if isinstance(self.match_expr, re.Pattern):
+            self._compiled = self.match_expr
+        elif self.match_expr is not None:
             try:
-                re.compile(self.match_expr)
+                self._compiled = _compile_pattern(self.match_expr)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern provided to 'match': {e}") from e
 
+        # Bound once so __exit__ skips the attribute lookup on the pattern.
+        self._search: Callable[[str], re.Match[str] | None] | None = (
+            self._compiled.search if self._compiled is not None else None
+        )
+
     def __enter__(self) -> RaisesContext:
         return self
 
+    def _did_not_raise_error(self) -> AssertionError:
+        # Kept out of __exit__ so the common path (an exception was raised)
+        # does not carry the message formatting.
+        expected = self.expected_exception
+        if isinstance(expected, tuple):
+            names = ", ".join(e.__name__ for e in expected)
+            return AssertionError(f"DID NOT RAISE any of ({names})")
+        return AssertionError(f"DID NOT RAISE {expected.__name__}")
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -41,18 +69,16 @@ class RaisesContext:
         _exc_tb: TracebackType | None,
     ) -> bool:
         if exc_type is None:
-            expected = self.expected_exception
-            if isinstance(expected, tuple):
-                names = ", ".join(e.__name__ for e in expected)
-                raise AssertionError(f"DID NOT RAISE any of ({names})")
-            raise AssertionError(f"DID NOT RAISE {expected.__name__}")
+            raise self._did_not_raise_error()
 
-        if not issubclass(exc_type, self.expected_exception):
+        # Identity check first: raises(ValueError) catching exactly ValueError
+        # is the common case and avoids the issubclass MRO walk.
+        if exc_type is not self._exc_single and not issubclass(exc_type, self.expected_exception):
             return False
 
-        if self.match_expr is not None:
+        if self._search is not None:
             value_str = str(exc_val)
-            if not re.search(self.match_expr, value_str):
+            if self._search(value_str) is None:
                 raise AssertionError(
                     f"Regex pattern did not match.\n Regex: {self.match_expr!r}\n Input: {value_str!r}"
                 ) from exc_val
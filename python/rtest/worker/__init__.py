@@ -1,5 +1,18 @@
 """rtest worker module for native test execution."""
 
-from rtest.worker.runner import run_tests
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rtest.worker.runner import run_tests
 
 __all__ = ["run_tests"]
+
+
+def __getattr__(name: str) -> object:
+    # The runner is imported on first use so that ``python -m rtest.worker``
+    # can reject a bad command line without paying for it.
+    if name == "run_tests":
+        from rtest.worker.runner import run_tests
+
+        return run_tests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,67 +2,189 @@
 
 Usage:
     python -m rtest.worker --root <repo_root> --out <out.jsonl> <file1.py> <file2.py> ...
+    python -m rtest.worker --serve
+
+With ``--serve`` the worker stays alive and runs one job per JSON line read
+from stdin, answering each with a JSON line on stdout (see ``runner.serve``).
+The protocol keeps private copies of those two streams, so tests and the
+processes they spawn see an empty stdin and a stdout that goes to stderr.
+
+The worker is spawned once per worker process by the Rust runner, so arguments
+are parsed by hand rather than with argparse to keep interpreter start-up cheap.
 """
 
-import argparse
+import os
 import sys
-from pathlib import Path
+from dataclasses import dataclass, field
+from typing import TextIO
+
+PROG = "python -m rtest.worker"
+
+USAGE = (
+    f"usage: {PROG} [-h] --root ROOT --out OUT [--python-classes PATTERN [PATTERN ...]]\n"
+    "       [--python-functions PATTERN [PATTERN ...]] files [files ...]\n"
+    f"       {PROG} --serve"
+)
+
+HELP = f"""{USAGE}
+
+rtest worker for native test execution
+
+positional arguments:
+  files                 Test files to run
+
+options:
+  -h, --help            show this help message and exit
+  --serve               Run JSON jobs read from stdin until end of input
+  --root ROOT           Repository root path for relative imports
+  --out OUT             Output JSONL file path for results
+  --python-classes PATTERN [PATTERN ...]
+                        Glob patterns for test class names using fnmatch syntax (default: Test*)
+  --python-functions PATTERN [PATTERN ...]
+                        Glob patterns for test function/method names using fnmatch syntax (default: test*)"""
+
+
+class UsageError(Exception):
+    """Raised when the worker command line is invalid."""
+
+
+@dataclass
+class WorkerArgs:
+    """Parsed worker command line."""
+
+    root: str
+    out: str
+    files: list[str]
+    python_classes: list[str] = field(default_factory=lambda: ["Test*"])
+    python_functions: list[str] = field(default_factory=lambda: ["test*"])
+
+
+def _take_values(argv: list[str], start: int, flag: str) -> tuple[list[str], int]:
+    """Consume one or more non-option values following ``flag``."""
+    end = start
+    while end < len(argv) and not argv[end].startswith("-"):
+        end += 1
+    if end == start:
+        raise UsageError(f"argument {flag}: expected at least one argument")
+    return argv[start:end], end
+
+
+def parse_args(argv: list[str]) -> WorkerArgs:
+    """Parse worker arguments with the same grammar the argparse CLI accepted.
 
-from rtest.worker.runner import run_tests
+    Raises:
+        UsageError: If a flag is unknown, missing its value, or required
+            arguments are absent.
+    """
+    root: str | None = None
+    out: str | None = None
+    files: list[str] = []
+    python_classes: list[str] | None = None
+    python_functions: list[str] | None = None
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            files.extend(argv[i + 1 :])
+            break
+        if not arg.startswith("-") or arg == "-":
+            files.append(arg)
+            i += 1
+            continue
+
+        flag, sep, inline_value = arg.partition("=")
+        if flag == "--serve":
+            # A lone --serve is dispatched by main() before parsing.
+            raise UsageError("--serve takes no other arguments")
+        if flag in ("--root", "--out"):
+            if sep:
+                value = inline_value
+                i += 1
+            elif i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+                value = argv[i + 1]
+                i += 2
+            else:
+                raise UsageError(f"argument {flag}: expected one argument")
+            if flag == "--root":
+                root = value
+            else:
+                out = value
+        elif flag in ("--python-classes", "--python-functions"):
+            if sep:
+                values = [inline_value]
+                i += 1
+            else:
+                values, i = _take_values(argv, i + 1, flag)
+            if flag == "--python-classes":
+                python_classes = values
+            else:
+                python_functions = values
+        else:
+            raise UsageError(f"unrecognized arguments: {arg}")
+
+    if root is None or out is None or not files:
+        missing = [name for name, value in (("--root", root), ("--out", out)) if value is None]
+        if not files:
+            missing.append("files")
+        raise UsageError(f"the following arguments are required: {', '.join(missing)}")
+
+    args = WorkerArgs(root=root, out=out, files=files)
+    if python_classes is not None:
+        args.python_classes = python_classes
+    if python_functions is not None:
+        args.python_functions = python_functions
+    return args
+
+
+def _claim_protocol_streams() -> tuple[TextIO, TextIO]:
+    """Move the serve protocol onto private copies of fds 0 and 1.
+
+    Afterwards fd 0 reads from the null device and fd 1 is a copy of stderr,
+    so a test that reads stdin, or a child process that inherits stdout,
+    cannot consume a request or corrupt a response.
+    """
+    sys.stdout.flush()
+    requests = os.fdopen(os.dup(0), "r")
+    responses = os.fdopen(os.dup(1), "w")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+    return requests, responses
 
 
 def main() -> int:
     """Run the worker CLI."""
-    parser = argparse.ArgumentParser(
-        description="rtest worker for native test execution",
-        prog="python -m rtest.worker",
-    )
-    parser.add_argument(
-        "--root",
-        type=Path,
-        required=True,
-        help="Repository root path for relative imports",
-    )
-    parser.add_argument(
-        "--out",
-        type=Path,
-        required=True,
-        help="Output JSONL file path for results",
-    )
-    parser.add_argument(
-        "--python-classes",
-        nargs="+",
-        default=["Test*"],
-        help="Glob patterns for test class names using fnmatch syntax (default: Test*)",
-    )
-    parser.add_argument(
-        "--python-functions",
-        nargs="+",
-        default=["test*"],
-        help="Glob patterns for test function/method names using fnmatch syntax (default: test*)",
-    )
-    parser.add_argument(
-        "files",
-        nargs="+",
-        type=Path,
-        help="Test files to run",
-    )
+    argv = sys.argv[1:]
+    options = argv[: argv.index("--")] if "--" in argv else argv
+    if "-h" in options or "--help" in options:
+        print(HELP)
+        return 0
+
+    if argv == ["--serve"]:
+        from rtest.worker.runner import serve
+
+        requests, responses = _claim_protocol_streams()
+        return serve(requests, responses)
+
+    try:
+        args = parse_args(argv)
+    except UsageError as e:
+        print(f"{USAGE}\n{PROG}: error: {e}", file=sys.stderr)
+        return 2
 
-    args = parser.parse_args()
+    # Deferred so invalid command lines exit before the runner is imported.
+    from pathlib import Path
 
-    # Extract typed values from args
-    root: Path = args.root
-    output_file: Path = args.out
-    test_files: list[Path] = args.files
-    python_classes: list[str] = args.python_classes
-    python_functions: list[str] = args.python_functions
+    from rtest.worker.runner import run_tests
 
     return run_tests(
-        root=root,
-        output_file=output_file,
-        test_files=test_files,
-        python_classes=python_classes,
-        python_functions=python_functions,
+        root=Path(args.root),
+        output_file=Path(args.out),
+        test_files=[Path(f) for f in args.files],
+        python_classes=args.python_classes,
+        python_functions=args.python_functions,
     )
 
 
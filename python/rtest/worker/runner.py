@@ -7,13 +7,14 @@ import inspect
 import io
 import json
 import sys
+import sysconfig
 import time
 import traceback
 import warnings
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from types import FunctionType, MappingProxyType, ModuleType
-from typing import Callable, Literal
+from typing import Any, Callable, Literal, TextIO
 
 
 @dataclass
@@ -331,3 +332,91 @@ def run_tests(
 
     has_failures = any(r.outcome in ("failed", "error") for r in results)
     return 1 if has_failures else 0
+
+
+def _is_project_module(module: object, project_dirs: set[Path], env_dirs: set[Path]) -> bool:
+    """Return whether ``module`` was loaded from ``project_dirs`` rather than an installed location.
+
+    Namespace packages have no ``__file__``, so their ``__path__`` entries are checked instead.
+    """
+    file = getattr(module, "__file__", None)
+    locations = [file] if file is not None else list(getattr(module, "__path__", None) or [])
+    for location in locations:
+        path = Path(location).resolve()
+        if any(path.is_relative_to(d) for d in env_dirs):
+            return False
+        if any(path.is_relative_to(d) for d in project_dirs):
+            return True
+    return False
+
+
+def _run_job(job: dict[str, Any]) -> int:
+    """Run one serve job, undoing its ``sys.path`` and project ``sys.modules`` changes afterwards.
+
+    Without this, a sibling module imported by one job (e.g. ``helper_mod``)
+    would be reused by the next job's ``import helper_mod`` even when that
+    job's root holds a different file of the same name. Only modules loaded
+    from the job's root or test directories are dropped: stdlib and installed
+    packages stay imported, since some extension modules cannot be
+    initialised twice in one process.
+    """
+    root = Path(job["root"])
+    test_files = [Path(f) for f in job["files"]]
+    job_dirs = {root.resolve(), *(f.parent.resolve() for f in test_files)}
+    # A virtualenv inside the project root still holds installed packages.
+    env_paths = sysconfig.get_paths()
+    env_dirs = {Path(env_paths[key]).resolve() for key in ("stdlib", "platstdlib", "purelib", "platlib")}
+
+    saved_path = list(sys.path)
+    saved_modules = set(sys.modules)
+    try:
+        return run_tests(
+            root=root,
+            output_file=Path(job["out"]),
+            test_files=test_files,
+            python_classes=job.get("python_classes"),
+            python_functions=job.get("python_functions"),
+        )
+    finally:
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - saved_modules:
+            if _is_project_module(sys.modules[name], job_dirs, env_dirs):
+                del sys.modules[name]
+
+
+def serve(requests: TextIO, responses: TextIO) -> int:
+    """Run jobs read as JSON lines from ``requests`` until end of input.
+
+    Each request mirrors the CLI arguments: an object with ``root``, ``out``
+    and ``files`` keys, plus optional ``python_classes`` and
+    ``python_functions``. Once a job's results file is complete, one
+    ``{"exit_code": N}`` line is written to ``responses``. A job that cannot
+    be run (invalid JSON, a missing key, an unwritable ``out``) is answered
+    with ``{"exit_code": 2, "error": "<traceback>"}`` and the loop carries on.
+
+    Jobs share one interpreter. ``sys.path`` is restored after each job, and
+    modules first imported by a job are dropped from ``sys.modules`` only when
+    they were loaded from the job's root or test directories; stdlib and
+    installed packages a job imports stay loaded for later jobs. Other
+    process-wide state a test changes (environment variables, the working
+    directory, attributes patched on modules loaded before the job) also
+    carries over.
+
+    Args:
+        requests: Stream of JSON job requests, one per line.
+        responses: Stream that receives one JSON response per job.
+
+    Returns:
+        Exit code: always 0 once ``requests`` is exhausted.
+    """
+    for line in requests:
+        if not line.strip():
+            continue
+        response: dict[str, object]
+        try:
+            response = {"exit_code": _run_job(json.loads(line))}
+        except Exception:
+            response = {"exit_code": 2, "error": traceback.format_exc()}
+        responses.write(json.dumps(response) + "\n")
+        responses.flush()
+    return 0
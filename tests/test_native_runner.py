@@ -1,17 +1,27 @@
 """Integration tests for the native rtest runner."""
 
+import asyncio
+import atexit
+import functools
+import io
 import json
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import TypedDict
+from typing import NamedTuple, TypedDict
 
 import rtest
 from rtest.exit_code import ExitCodeValues
 from rtest.mark import PARAMETRIZE_DEPRECATION_MSG, SKIP_DEPRECATION_MSG
+from rtest.worker.__main__ import UsageError, parse_args
+from rtest.worker.runner import serve
 
 FIXTURES_DIR = Path(__file__).parent.parent / "test_utils" / "fixtures"
+RTEST_ROOT = FIXTURES_DIR.parent.parent
+
+# Command prefix shared by the sync and async CLI helpers.
+RTEST_NATIVE_CMD = [sys.executable, "-m", "rtest", "--runner", "native"]
 
 
 class WorkerResultDict(TypedDict, total=False):
@@ -26,35 +36,160 @@ class WorkerResultDict(TypedDict, total=False):
     error_type: str | None
 
 
-def run_worker(test_file: Path, root: Path, output_file: Path) -> list[WorkerResultDict]:
-    """Run the worker on a test file and return results."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "rtest.worker",
-            "--root",
-            str(root),
-            "--out",
-            str(output_file),
-            str(test_file),
-        ],
+def read_results(output_file: Path) -> list[WorkerResultDict]:
+    """Parse a worker JSONL results file in a single read."""
+    # json.loads accepts bytes, so skip the text-mode decode and newline translation
+    return [json.loads(line) for line in output_file.read_bytes().splitlines() if line.strip()]
+
+
+def _rtest_cli(extra: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+    """Run ``python -m rtest --runner native`` with extra arguments in ``cwd``."""
+    return subprocess.run(
+        [*RTEST_NATIVE_CMD, *extra],
         capture_output=True,
         text=True,
-        cwd=str(root),
+        cwd=str(cwd),
     )
 
+
+@functools.cache
+def results_dir() -> Path:
+    """Directory shared by worker JSONL outputs for the session, removed at exit.
+
+    Tests that need an isolated project directory still make their own.
+    """
+    tmp_dir = tempfile.TemporaryDirectory()
+    atexit.register(tmp_dir.cleanup)
+    return Path(tmp_dir.name)
+
+
+# One long-lived ``rtest.worker --serve`` process per root, shared by every
+# run_worker call so interpreter start-up is paid once per test session.
+_persistent_workers: dict[Path, subprocess.Popen[str]] = {}
+
+
+def _stop_worker(proc: subprocess.Popen[str]) -> None:
+    """Close the worker's stdin so it exits, then reap it."""
+    if proc.stdin is not None:
+        proc.stdin.close()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def _worker_stderr_path(root: Path) -> Path:
+    """File collecting the serving worker's stderr for ``root``."""
+    return results_dir() / f"worker-{abs(hash(root))}.stderr"
+
+
+def _worker_stderr(root: Path) -> str:
+    """Return everything the serving worker for ``root`` has written to stderr."""
+    stderr_path = _worker_stderr_path(root)
+    return stderr_path.read_text() if stderr_path.exists() else ""
+
+
+def _persistent_worker(root: Path) -> subprocess.Popen[str]:
+    """Return the serving worker for ``root``, starting it if needed."""
+    proc = _persistent_workers.get(root)
+    if proc is None or proc.poll() is not None:
+        # stderr goes to a file rather than this process's stderr, which the
+        # native runner discards, so failures below can quote it.
+        with _worker_stderr_path(root).open("a") as stderr:
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "rtest.worker", "--serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                text=True,
+                cwd=str(root),
+            )
+        _persistent_workers[root] = proc
+        atexit.register(_stop_worker, proc)
+    return proc
+
+
+def submit_worker_job(test_files: list[Path], root: Path, output_file: Path) -> int:
+    """Run one job on the persistent worker and return its exit code."""
+    worker = _persistent_worker(root)
+    assert worker.stdin is not None and worker.stdout is not None
+    job = {"root": str(root), "out": str(output_file), "files": [str(f) for f in test_files]}
+    worker.stdin.write(json.dumps(job) + "\n")
+    worker.stdin.flush()
+
+    # Wait for the job to finish
+    response = worker.stdout.readline()
+    if not response:
+        raise AssertionError(
+            f"Worker exited with code {worker.wait()} before finishing {test_files}. stderr: {_worker_stderr(root)}"
+        )
+    reply = json.loads(response)
+    if "error" in reply:
+        raise AssertionError(f"Worker could not run {test_files}: {reply['error']}")
+    exit_code: int = reply["exit_code"]
+    return exit_code
+
+
+def run_worker(test_files: list[Path], root: Path, output_file: Path) -> list[WorkerResultDict]:
+    """Run the worker on one or more test files in a single job and return results."""
+    submit_worker_job(test_files, root, output_file)
+
     # Parse results
     if not output_file.exists():
-        raise AssertionError(f"Output file not created. stderr: {result.stderr}")
+        raise AssertionError(f"Output file not created for {test_files}. stderr: {_worker_stderr(root)}")
+
+    return read_results(output_file)
+
+
+# Fixture files run together through a single worker job by fixture_results().
+BATCHED_FIXTURES = (
+    "test_class.py",
+    "test_outcomes.py",
+    "test_parametrize.py",
+    "test_raises.py",
+    "test_skip.py",
+)
+
+
+@functools.cache
+def _batched_fixture_results() -> dict[str, list[WorkerResultDict]]:
+    """Run the worker once over all batched fixtures, grouping results by file name."""
+    results = run_worker(
+        [FIXTURES_DIR / name for name in BATCHED_FIXTURES],
+        RTEST_ROOT,
+        results_dir() / "batched_fixtures.jsonl",
+    )
+
+    by_file: dict[str, list[WorkerResultDict]] = {name: [] for name in BATCHED_FIXTURES}
+    for r in results:
+        by_file[Path(r["nodeid"].split("::", 1)[0]).name].append(r)
+    return by_file
+
+
+def fixture_results(fixture_name: str) -> list[WorkerResultDict]:
+    """Return the worker results for one of the batched fixture files.
+
+    Callers must treat the returned list as read-only since it is shared.
+    """
+    return _batched_fixture_results()[fixture_name]
+
+
+def group_by_test(results: list[WorkerResultDict]) -> dict[str, list[WorkerResultDict]]:
+    """Group results by test name within their file, dropping any case suffix.
+
+    ``path/test_x.py::TestCls::test_y[1-2]`` is filed under ``TestCls::test_y``.
+    """
+    by_test: dict[str, list[WorkerResultDict]] = {}
+    for r in results:
+        name = r["nodeid"].split("[", 1)[0].split("::", 1)[-1]
+        by_test.setdefault(name, []).append(r)
+    return by_test
 
-    results: list[WorkerResultDict] = []
-    with output_file.open() as f:
-        for line in f:
-            if line.strip():
-                parsed: WorkerResultDict = json.loads(line)
-                results.append(parsed)
-    return results
+
+@functools.cache
+def fixture_results_by_test(fixture_name: str) -> dict[str, list[WorkerResultDict]]:
+    """Return :func:`fixture_results` for a fixture file grouped by :func:`group_by_test`."""
+    return group_by_test(fixture_results(fixture_name))
 
 
 class TestParametrizeIntegration:
@@ -62,104 +197,69 @@ class TestParametrizeIntegration:
 
     def test_single_param_generates_correct_nodeids(self) -> None:
         """Single @parametrize generates correct number of test cases."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_parametrize.py",
-                FIXTURES_DIR.parent.parent,  # rtest root
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_parametrize.py")
 
-            # Find the single param tests
-            single_param_results = [r for r in results if "::test_single_param[" in r["nodeid"]]
-            assert len(single_param_results) == 3
+        # Find the single param tests
+        single_param_results = by_test["test_single_param"]
+        assert len(single_param_results) == 3
 
-            # Check nodeids have correct format - extract param suffixes
-            nodeids = [r["nodeid"] for r in single_param_results]
-            suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
-            assert suffixes == {"1", "2", "3"}
+        # Check nodeids have correct format - extract param suffixes
+        nodeids = [r["nodeid"] for r in single_param_results]
+        suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
+        assert suffixes == {"1", "2", "3"}
 
-            # All should pass
-            assert all(r["outcome"] == "passed" for r in single_param_results)
+        # All should pass
+        assert all(r["outcome"] == "passed" for r in single_param_results)
 
     def test_multi_param_generates_correct_cases(self) -> None:
         """Multiple parameter @parametrize works correctly."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_parametrize.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_parametrize.py")
 
-            multi_param_results = [r for r in results if "::test_multi_param[" in r["nodeid"]]
-            assert len(multi_param_results) == 3
-            assert all(r["outcome"] == "passed" for r in multi_param_results)
+        multi_param_results = by_test["test_multi_param"]
+        assert len(multi_param_results) == 3
+        assert all(r["outcome"] == "passed" for r in multi_param_results)
 
     def test_stacked_params_cartesian_product(self) -> None:
         """Stacked @parametrize produces cartesian product."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_parametrize.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_parametrize.py")
 
-            stacked_results = [r for r in results if "::test_stacked_params[" in r["nodeid"]]
-            # 2 values for a * 2 values for b = 4 cases
-            assert len(stacked_results) == 4
-            assert all(r["outcome"] == "passed" for r in stacked_results)
+        stacked_results = by_test["test_stacked_params"]
+        # 2 values for a * 2 values for b = 4 cases
+        assert len(stacked_results) == 4
+        assert all(r["outcome"] == "passed" for r in stacked_results)
 
-            # Check case IDs are cartesian product - extract param suffixes
-            nodeids = [r["nodeid"] for r in stacked_results]
-            suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
-            assert suffixes == {"1-10", "1-20", "2-10", "2-20"}
+        # Check case IDs are cartesian product - extract param suffixes
+        nodeids = [r["nodeid"] for r in stacked_results]
+        suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
+        assert suffixes == {"1-10", "1-20", "2-10", "2-20"}
 
     def test_explicit_ids(self) -> None:
         """Explicit ids are used in nodeids."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_parametrize.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_parametrize.py")
 
-            id_results = [r for r in results if "::test_with_ids[" in r["nodeid"]]
-            nodeids = [r["nodeid"] for r in id_results]
-            suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
-            assert suffixes == {"one", "two"}
+        id_results = by_test["test_with_ids"]
+        nodeids = [r["nodeid"] for r in id_results]
+        suffixes = {n.split("[")[1].rstrip("]") for n in nodeids}
+        assert suffixes == {"one", "two"}
 
     def test_runtime_evaluated_params(self) -> None:
         """Runtime-evaluated Python values work as parameters."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_parametrize.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_parametrize.py")
 
-            # Function call params
-            func_results = [r for r in results if "::test_function_call_params[" in r["nodeid"]]
-            assert len(func_results) == 3
-            assert all(r["outcome"] == "passed" for r in func_results)
+        # Function call params
+        func_results = by_test["test_function_call_params"]
+        assert len(func_results) == 3
+        assert all(r["outcome"] == "passed" for r in func_results)
 
-            # Object params
-            obj_results = [r for r in results if "::test_object_params[" in r["nodeid"]]
-            assert len(obj_results) == 2
-            assert all(r["outcome"] == "passed" for r in obj_results)
+        # Object params
+        obj_results = by_test["test_object_params"]
+        assert len(obj_results) == 2
+        assert all(r["outcome"] == "passed" for r in obj_results)
 
-            # Stdlib object params
-            dt_results = [r for r in results if "::test_stdlib_object_params[" in r["nodeid"]]
-            assert len(dt_results) == 2
-            assert all(r["outcome"] == "passed" for r in dt_results)
+        # Stdlib object params
+        dt_results = by_test["test_stdlib_object_params"]
+        assert len(dt_results) == 2
+        assert all(r["outcome"] == "passed" for r in dt_results)
 
 
 class TestSkipIntegration:
@@ -167,36 +267,22 @@ class TestSkipIntegration:
 
     def test_skipped_tests_marked_as_skipped(self) -> None:
         """@skip decorator marks tests as skipped."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_skip.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_skip.py")
 
-            skipped_with_reason = [r for r in results if r["nodeid"].endswith("::test_skipped_with_reason")]
-            assert len(skipped_with_reason) == 1
-            assert skipped_with_reason[0]["outcome"] == "skipped"
-            error_dict = skipped_with_reason[0].get("error")
-            assert error_dict is not None
-            assert error_dict["reason"] == "not implemented"
+        skipped_with_reason = by_test["test_skipped_with_reason"]
+        assert len(skipped_with_reason) == 1
+        assert skipped_with_reason[0]["outcome"] == "skipped"
+        error_dict = skipped_with_reason[0].get("error")
+        assert error_dict is not None
+        assert error_dict["reason"] == "not implemented"
 
     def test_class_skip_skips_all_methods(self) -> None:
         """@skip on class skips all methods."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_skip.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        results = fixture_results("test_skip.py")
 
-            class_methods = [r for r in results if "::TestSkippedClass::" in r["nodeid"]]
-            assert len(class_methods) == 2
-            assert all(r["outcome"] == "skipped" for r in class_methods)
+        class_methods = [r for r in results if "::TestSkippedClass::" in r["nodeid"]]
+        assert len(class_methods) == 2
+        assert all(r["outcome"] == "skipped" for r in class_methods)
 
 
 class TestClassDiscovery:
@@ -204,33 +290,19 @@ class TestClassDiscovery:
 
     def test_discovers_class_methods(self) -> None:
         """Test methods in classes are discovered."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_class.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        results = fixture_results("test_class.py")
 
-            basic_class = [r for r in results if "::TestBasicClass::" in r["nodeid"]]
-            assert len(basic_class) == 2
-            assert all(r["outcome"] == "passed" for r in basic_class)
+        basic_class = [r for r in results if "::TestBasicClass::" in r["nodeid"]]
+        assert len(basic_class) == 2
+        assert all(r["outcome"] == "passed" for r in basic_class)
 
     def test_parametrized_class_methods(self) -> None:
         """Parametrized methods in classes work correctly."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_class.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_class.py")
 
-            param_method = [r for r in results if "::TestParametrizedClass::test_param_method[" in r["nodeid"]]
-            assert len(param_method) == 2
-            assert all(r["outcome"] == "passed" for r in param_method)
+        param_method = by_test["TestParametrizedClass::test_param_method"]
+        assert len(param_method) == 2
+        assert all(r["outcome"] == "passed" for r in param_method)
 
 
 class TestOutcomes:
@@ -238,95 +310,64 @@ class TestOutcomes:
 
     def test_all_outcomes(self) -> None:
         """Validate all test outcome types in single run."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_outcomes.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_outcomes.py")
 
-            # Pass
-            passed = [r for r in results if r["nodeid"].endswith("::test_pass")]
-            assert len(passed) == 1
-            assert passed[0]["outcome"] == "passed"
+        # Pass
+        passed = by_test["test_pass"]
+        assert len(passed) == 1
+        assert passed[0]["outcome"] == "passed"
 
-            # Fail
-            failed = [r for r in results if r["nodeid"].endswith("::test_fail")]
-            assert len(failed) == 1
-            assert failed[0]["outcome"] == "failed"
-            assert failed[0]["error_type"] == AssertionError.__name__
+        # Fail
+        failed = by_test["test_fail"]
+        assert len(failed) == 1
+        assert failed[0]["outcome"] == "failed"
+        assert failed[0]["error_type"] == AssertionError.__name__
 
-            # Error
-            error = [r for r in results if r["nodeid"].endswith("::test_error")]
-            assert len(error) == 1
-            assert error[0]["outcome"] == "error"
-            assert error[0]["error_type"] == RuntimeError.__name__
+        # Error
+        error = by_test["test_error"]
+        assert len(error) == 1
+        assert error[0]["outcome"] == "error"
+        assert error[0]["error_type"] == RuntimeError.__name__
 
-            # Stdout/stderr capture
-            with_output = [r for r in results if r["nodeid"].endswith("::test_pass_with_output")]
-            assert len(with_output) == 1
-            assert with_output[0]["stdout"].strip() == "stdout message"
-            assert with_output[0]["stderr"].strip() == "stderr message"
+        # Stdout/stderr capture
+        with_output = by_test["test_pass_with_output"]
+        assert len(with_output) == 1
+        assert with_output[0]["stdout"].strip() == "stdout message"
+        assert with_output[0]["stderr"].strip() == "stderr message"
 
 
 class TestRaisesIntegration:
     def test_raises_outcomes(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            results = run_worker(
-                FIXTURES_DIR / "test_raises.py",
-                FIXTURES_DIR.parent.parent,
-                output_file,
-            )
+        by_test = fixture_results_by_test("test_raises.py")
 
-            def outcome_for(name: str) -> str:
-                matches = [r for r in results if r["nodeid"].endswith(f"::{name}")]
-                assert len(matches) == 1, f"Expected 1 result for {name}, got {len(matches)}"
-                return matches[0]["outcome"]
+        def outcome_for(name: str) -> str:
+            matches = by_test.get(name, [])
+            assert len(matches) == 1, f"Expected 1 result for {name}, got {len(matches)}"
+            return matches[0]["outcome"]
 
-            assert outcome_for("test_raises_expected") == "passed"
-            assert outcome_for("test_raises_with_match") == "passed"
-            assert outcome_for("test_raises_no_exception") == "failed"
-            assert outcome_for("test_raises_wrong_exception") == "error"
-            assert outcome_for("test_raises_match_fails") == "failed"
-            assert outcome_for("test_raises_value_attribute") == "passed"
-            assert outcome_for("test_raises_exception_tuple") == "passed"
-            assert outcome_for("test_raises_subclass") == "passed"
+        assert outcome_for("test_raises_expected") == "passed"
+        assert outcome_for("test_raises_with_match") == "passed"
+        assert outcome_for("test_raises_no_exception") == "failed"
+        assert outcome_for("test_raises_wrong_exception") == "error"
+        assert outcome_for("test_raises_match_fails") == "failed"
+        assert outcome_for("test_raises_value_attribute") == "passed"
+        assert outcome_for("test_raises_exception_tuple") == "passed"
+        assert outcome_for("test_raises_subclass") == "passed"
 
 
 class TestWorkerExitCode:
     """Tests for worker exit code behavior."""
 
-    @rtest.mark.cases(
-        "test_file,expected_code",
-        [
-            ("test_parametrize.py", 0),  # all pass
-            ("test_outcomes.py", 1),  # has failures
-        ],
-    )
-    def test_exit_code(self, test_file: str, expected_code: int) -> None:
+    def test_exit_code(self) -> None:
         """Worker exit code reflects test results."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "rtest.worker",
-                    "--root",
-                    str(FIXTURES_DIR.parent.parent),
-                    "--out",
-                    str(output_file),
-                    str(FIXTURES_DIR / test_file),
-                ],
-                capture_output=True,
-                text=True,
-            )
-            assert result.returncode == expected_code
+        cases = [
+            ("test_parametrize.py", ExitCodeValues.OK),  # all pass
+            ("test_outcomes.py", ExitCodeValues.TESTS_FAILED),  # has failures
+        ]
+        for test_file, expected_code in cases:
+            output_file = results_dir() / f"exit_code_{test_file}.jsonl"
+            exit_code = submit_worker_job([FIXTURES_DIR / test_file], RTEST_ROOT, output_file)
+            assert exit_code == expected_code, f"{test_file}: expected {expected_code}, got {exit_code}"
 
     def test_exit_code_zero_on_skip_only(self) -> None:
         """Worker exits with 0 when tests are only skipped (no failures)."""
@@ -354,140 +395,324 @@ class TestWorkerExitCode:
             assert result.returncode == ExitCodeValues.OK
 
 
-class TestNativeRunnerCLI:
-    """Integration tests for the native runner via CLI."""
+class TestWorkerArgs:
+    """Tests for the worker command-line parser."""
+
+    def test_parses_runner_invocation(self) -> None:
+        """Parses the argv shape the Rust native runner passes."""
+        args = parse_args(
+            [
+                "--root",
+                "/repo",
+                "--out",
+                "/tmp/out.jsonl",
+                "--python-classes",
+                "Test*",
+                "*Suite",
+                "--python-functions",
+                "check_*",
+                "--",
+                "test_a.py",
+                "test_b.py",
+            ]
+        )
+        assert args.root == "/repo"
+        assert args.out == "/tmp/out.jsonl"
+        assert args.python_classes == ["Test*", "*Suite"]
+        assert args.python_functions == ["check_*"]
+        assert args.files == ["test_a.py", "test_b.py"]
+
+    def test_defaults_and_inline_values(self) -> None:
+        """Unset patterns use defaults and --flag=value is accepted."""
+        args = parse_args(["test_a.py", "--root=/repo", "--out=out.jsonl"])
+        assert args.root == "/repo"
+        assert args.out == "out.jsonl"
+        assert args.files == ["test_a.py"]
+        assert args.python_classes == ["Test*"]
+        assert args.python_functions == ["test*"]
+
+    def test_missing_required_arguments(self) -> None:
+        """Missing --out and files are reported together."""
+        with rtest.raises(UsageError, match="required: --out, files"):
+            parse_args(["--root", "/repo"])
+
+    def test_flag_without_value(self) -> None:
+        """A flag directly followed by another flag is rejected."""
+        with rtest.raises(UsageError, match="argument --root: expected one argument"):
+            parse_args(["--root", "--out", "out.jsonl", "test_a.py"])
+
+    def test_unknown_flag(self) -> None:
+        """Unknown options are rejected."""
+        with rtest.raises(UsageError, match="unrecognized arguments: --bogus"):
+            parse_args(["--root", "/repo", "--out", "out.jsonl", "--bogus", "test_a.py"])
+
+    def test_serve_with_other_arguments(self) -> None:
+        """--serve combined with a run command line gets its own error."""
+        with rtest.raises(UsageError, match="--serve takes no other arguments"):
+            parse_args(["--serve", "--root", "/repo", "--out", "out.jsonl", "test_a.py"])
+
+    def test_usage_error_exits_with_code_two(self) -> None:
+        """Invalid command lines exit with status 2 and print usage."""
+        result = subprocess.run(
+            [sys.executable, "-m", "rtest.worker", "--root", "/repo"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 2
+        assert "usage: python -m rtest.worker" in result.stderr
+
+
+def _serve_job(root: Path, output_file: Path, files: list[Path]) -> str:
+    """Encode one ``serve`` request line."""
+    return json.dumps({"root": str(root), "out": str(output_file), "files": [str(f) for f in files]}) + "\n"
+
+
+class TestWorkerServe:
+    """Tests for the worker's --serve job loop."""
+
+    def test_jobs_do_not_share_sibling_modules(self) -> None:
+        """A sibling module imported by one job is not reused by the next."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            requests = io.StringIO()
+            for name in ("a", "b"):
+                project = tmp_path / name
+                project.mkdir()
+                (project / "helper_mod.py").write_text(f"VALUE = {name!r}\n")
+                test_file = project / f"test_{name}.py"
+                test_file.write_text(
+                    f"from helper_mod import VALUE\n\ndef test_value():\n    assert VALUE == {name!r}\n"
+                )
+                requests.write(_serve_job(project, tmp_path / f"{name}.jsonl", [test_file]))
+            requests.seek(0)
+
+            responses = io.StringIO()
+            assert serve(requests, responses) == 0
+
+        exit_codes = [json.loads(line)["exit_code"] for line in responses.getvalue().splitlines()]
+        assert exit_codes == [0, 0]
+
+    def test_blank_lines_and_bad_jobs_do_not_stop_the_loop(self) -> None:
+        """Blank lines are skipped and a bad job gets an error response."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            test_file = tmp_path / "test_ok.py"
+            test_file.write_text("def test_ok():\n    assert True\n")
+            requests = io.StringIO(
+                _serve_job(tmp_path, tmp_path / "first.jsonl", [test_file])
+                + "\n"
+                + json.dumps({"root": str(tmp_path)})
+                + "\n"
+                + "not json\n"
+                + _serve_job(tmp_path, tmp_path / "second.jsonl", [test_file])
+            )
+            responses = io.StringIO()
+            assert serve(requests, responses) == 0
+
+            first_results = read_results(tmp_path / "first.jsonl")
+            second_results = read_results(tmp_path / "second.jsonl")
+
+        replies = [json.loads(line) for line in responses.getvalue().splitlines()]
+        assert [r["exit_code"] for r in replies] == [0, 2, 2, 0]
+        assert "KeyError" in replies[1]["error"]
+        assert "JSONDecodeError" in replies[2]["error"]
+        assert "error" not in replies[0] and "error" not in replies[3]
+        assert [r["outcome"] for r in first_results + second_results] == ["passed", "passed"]
+
+    def test_installed_modules_stay_loaded(self) -> None:
+        """Only modules from the job's directories are dropped after the job."""
+        sys.modules.pop("colorsys", None)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            (tmp_path / "helper_kept.py").write_text("VALUE = 1\n")
+            test_file = tmp_path / "test_imports.py"
+            test_file.write_text("import colorsys\nimport helper_kept\n\ndef test_ok():\n    assert True\n")
+            responses = io.StringIO()
+            serve(io.StringIO(_serve_job(tmp_path, tmp_path / "out.jsonl", [test_file])), responses)
+
+        assert json.loads(responses.getvalue())["exit_code"] == 0
+        assert "colorsys" in sys.modules
+        assert "helper_kept" not in sys.modules
 
-    def test_native_runner_collect_only(self) -> None:
-        """--runner native --collect-only shows discovered tests."""
+    def test_tests_cannot_touch_the_protocol_streams(self) -> None:
+        """Child output on fd 1 and reads from stdin leave requests and replies intact."""
         with tempfile.TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_example.py"
-            test_file.write_text("def test_one(): pass\ndef test_two(): pass\n")
-
+            test_file = tmp_path / "test_streams.py"
+            test_file.write_text(
+                "import subprocess\nimport sys\n\n"
+                "def test_child_prints():\n"
+                "    subprocess.run([sys.executable, '-c', 'print(\"stray\")'], check=True)\n\n"
+                "def test_reads_stdin():\n"
+                "    assert sys.stdin.read() == ''\n"
+            )
+            requests = "".join(_serve_job(tmp_path, tmp_path / f"{i}.jsonl", [test_file]) for i in range(3))
             result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "--collect-only"],
+                [sys.executable, "-m", "rtest.worker", "--serve"],
+                input=requests,
                 capture_output=True,
                 text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "test_one" in result.stdout
-            assert "test_two" in result.stdout
+                timeout=60,
+            )
+
+        assert result.returncode == 0, result.stderr
+        assert [json.loads(line) for line in result.stdout.splitlines()] == [{"exit_code": 0}] * 3, result.stderr
+        assert "stray" in result.stderr
+
+
+class CLICase(NamedTuple):
+    """One native-runner CLI invocation and what it should produce."""
+
+    description: str
+    files: dict[str, str]
+    args: list[str]
+    expected_code: int
+    expected_output: tuple[str, ...]
+
+
+NATIVE_RUNNER_CLI_CASES = [
+    CLICase(
+        "--collect-only shows discovered tests",
+        {"test_example.py": "def test_one(): pass\ndef test_two(): pass\n"},
+        ["--collect-only"],
+        ExitCodeValues.OK,
+        ("test_one", "test_two"),
+    ),
+    CLICase(
+        "exits 0 when all tests pass",
+        {"test_pass.py": "def test_pass(): assert True\n"},
+        ["-n", "1"],
+        ExitCodeValues.OK,
+        ("PASSED",),
+    ),
+    CLICase(
+        "exits 1 when tests fail",
+        {"test_fail.py": "def test_fail(): assert False\n"},
+        ["-n", "1"],
+        ExitCodeValues.TESTS_FAILED,
+        ("FAILED",),
+    ),
+    CLICase(
+        "distributes work across multiple workers",
+        {f"test_file{i}.py": f"def test_{i}(): assert True\n" for i in range(4)},
+        ["-n", "2"],
+        ExitCodeValues.OK,
+        ("4 passed",),
+    ),
+    CLICase(
+        "supports @rtest.mark.cases decorator",
+        {"test_param.py": 'import rtest\n\n@rtest.mark.cases("x", [1, 2, 3])\ndef test_param(x): assert x > 0\n'},
+        ["-n", "1"],
+        ExitCodeValues.OK,
+        ("3 passed",),
+    ),
+    CLICase(
+        "supports @rtest.mark.skip decorator",
+        {
+            "test_skip.py": 'import rtest\n\n@rtest.mark.skip(reason="test skip")\ndef test_skipped(): assert False\n'
+            "\ndef test_pass(): assert True\n"
+        },
+        ["-n", "1"],
+        ExitCodeValues.OK,
+        ("1 passed", "1 skipped"),
+    ),
+    CLICase(
+        "handles empty test directory gracefully",
+        {},
+        ["-n", "1"],
+        ExitCodeValues.OK,
+        ("No tests found",),
+    ),
+    CLICase(
+        "discovers and runs test class methods",
+        {"test_class.py": "class TestExample:\n    def test_method(self): assert True\n"},
+        ["-n", "1"],
+        ExitCodeValues.OK,
+        ("1 passed",),
+    ),
+]
+
+
+async def _rtest_cli_async(extra: list[str], cwd: Path) -> tuple[int, str, str]:
+    """Async counterpart of :func:`_rtest_cli`, returning ``(returncode, stdout, stderr)``."""
+    proc = await asyncio.create_subprocess_exec(
+        *RTEST_NATIVE_CMD,
+        *extra,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+    )
+    stdout, stderr = await proc.communicate()
+    assert proc.returncode is not None
+    return proc.returncode, stdout.decode(), stderr.decode()
 
-    def test_native_runner_passes_with_passing_tests(self) -> None:
-        """--runner native exits 0 when all tests pass."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_pass.py"
-            test_file.write_text("def test_pass(): assert True\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "PASSED" in result.stdout
+async def _run_cli_cases(cases: list[CLICase], tmp_path: Path) -> list[tuple[int, str, str]]:
+    """Run every case in its own project directory, all concurrently."""
+    project_dirs: list[Path] = []
+    for i, case in enumerate(cases):
+        project_dir = tmp_path / f"case{i}"
+        project_dir.mkdir()
+        for name, content in case.files.items():
+            (project_dir / name).write_text(content)
+        project_dirs.append(project_dir)
+    return await asyncio.gather(*(_rtest_cli_async(c.args, d) for c, d in zip(cases, project_dirs)))
 
-    def test_native_runner_fails_with_failing_tests(self) -> None:
-        """--runner native exits 1 when tests fail."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_fail.py"
-            test_file.write_text("def test_fail(): assert False\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.TESTS_FAILED
-            assert "FAILED" in result.stdout
+class TestNativeRunnerCLI:
+    """Integration tests for the native runner via CLI."""
 
-    def test_native_runner_with_multiple_workers(self) -> None:
-        """--runner native distributes work across multiple workers."""
+    def test_native_runner_cli_cases(self) -> None:
+        """--runner native cases, launched concurrently; every failing case is reported."""
         with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            # Create multiple test files
-            for i in range(4):
-                test_file = tmp_path / f"test_file{i}.py"
-                test_file.write_text(f"def test_{i}(): assert True\n")
+            outcomes = asyncio.run(_run_cli_cases(NATIVE_RUNNER_CLI_CASES, Path(tmp_dir)))
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "2"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "4 passed" in result.stdout
+        failures: list[str] = []
+        for case, (returncode, stdout, stderr) in zip(NATIVE_RUNNER_CLI_CASES, outcomes):
+            problems = [f"{expected!r} not in output" for expected in case.expected_output if expected not in stdout]
+            if returncode != case.expected_code:
+                problems.insert(0, f"exit code {returncode}, expected {case.expected_code}")
+            if problems:
+                failures.append(f"{case.description}: {'; '.join(problems)}\nstdout:\n{stdout}\nstderr:\n{stderr}")
+        assert not failures, "\n\n".join(failures)
 
-    def test_native_runner_with_parametrize(self) -> None:
-        """--runner native supports @rtest.mark.cases decorator."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_param.py"
-            test_file.write_text('import rtest\n\n@rtest.mark.cases("x", [1, 2, 3])\ndef test_param(x): assert x > 0\n')
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "3 passed" in result.stdout
+class CompatRun(NamedTuple):
+    """Results (grouped by :func:`group_by_test`) and stderr from one pytest-compat run."""
 
-    def test_native_runner_with_skip(self) -> None:
-        """--runner native supports @rtest.mark.skip decorator."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_skip.py"
-            test_file.write_text(
-                'import rtest\n\n@rtest.mark.skip(reason="test skip")\ndef test_skipped(): assert False\n'
-                "\ndef test_pass(): assert True\n"
-            )
+    by_test: dict[str, list[WorkerResultDict]]
+    stderr: str
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "1 passed" in result.stdout
-            assert "1 skipped" in result.stdout
 
-    def test_native_runner_no_tests_found(self) -> None:
-        """--runner native handles empty test directory gracefully."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "No tests found" in result.stdout
+@functools.cache
+def pytest_compat_run() -> CompatRun:
+    """Run the worker once on the pytest-compat fixture with warnings always shown.
 
-    def test_native_runner_class_tests(self) -> None:
-        """--runner native discovers and runs test class methods."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            test_file = tmp_path / "test_class.py"
-            test_file.write_text("class TestExample:\n    def test_method(self): assert True\n")
+    Uses its own process rather than the persistent worker so that ``-W always``
+    applies and the deprecation warnings land in this run's stderr.
+    """
+    output_file = results_dir() / "pytest_compat.jsonl"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "always",
+            "-m",
+            "rtest.worker",
+            "--root",
+            str(RTEST_ROOT),
+            "--out",
+            str(output_file),
+            str(FIXTURES_DIR / "test_pytest_compat.py"),
+        ],
+        capture_output=True,
+        text=True,
+        cwd=str(RTEST_ROOT),
+    )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
-            assert result.returncode == ExitCodeValues.OK
-            assert "1 passed" in result.stdout
+    # Should work
+    assert output_file.exists()
+    return CompatRun(group_by_test(read_results(output_file)), result.stderr)
 
 
 class TestPytestMarkerCompatibility:
@@ -495,85 +720,29 @@ class TestPytestMarkerCompatibility:
 
     def test_pytest_parametrize_works_with_deprecation(self) -> None:
         """@pytest.mark.parametrize works but emits deprecation warning."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-W",
-                    "always",
-                    "-m",
-                    "rtest.worker",
-                    "--root",
-                    str(FIXTURES_DIR.parent.parent),
-                    "--out",
-                    str(output_file),
-                    str(FIXTURES_DIR / "test_pytest_compat.py"),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=str(FIXTURES_DIR.parent.parent),
-            )
+        by_test, stderr = pytest_compat_run()
 
-            # Should work
-            assert output_file.exists()
-            results: list[WorkerResultDict] = []
-            with output_file.open() as f:
-                for line in f:
-                    if line.strip():
-                        parsed: WorkerResultDict = json.loads(line)
-                        results.append(parsed)
+        # Parametrized tests should run
+        param_results = by_test["test_pytest_parametrize"]
+        assert len(param_results) == 3
+        assert all(r["outcome"] == "passed" for r in param_results)
 
-            # Parametrized tests should run
-            param_results = [r for r in results if "::test_pytest_parametrize[" in r["nodeid"]]
-            assert len(param_results) == 3
-            assert all(r["outcome"] == "passed" for r in param_results)
-
-            # Should emit deprecation warning with exact message
-            expected_warning = PARAMETRIZE_DEPRECATION_MSG.format(func_name="test_pytest_parametrize")
-            assert expected_warning in result.stderr
+        # Should emit deprecation warning with exact message
+        expected_warning = PARAMETRIZE_DEPRECATION_MSG.format(func_name="test_pytest_parametrize")
+        assert expected_warning in stderr
 
     def test_pytest_skip_works_with_deprecation(self) -> None:
         """@pytest.mark.skip works but emits deprecation warning."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-            output_file = tmp_path / "results.jsonl"
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-W",
-                    "always",
-                    "-m",
-                    "rtest.worker",
-                    "--root",
-                    str(FIXTURES_DIR.parent.parent),
-                    "--out",
-                    str(output_file),
-                    str(FIXTURES_DIR / "test_pytest_compat.py"),
-                ],
-                capture_output=True,
-                text=True,
-                cwd=str(FIXTURES_DIR.parent.parent),
-            )
+        by_test, stderr = pytest_compat_run()
 
-            # Should work
-            assert output_file.exists()
-            results: list[WorkerResultDict] = []
-            with output_file.open() as f:
-                for line in f:
-                    if line.strip():
-                        parsed: WorkerResultDict = json.loads(line)
-                        results.append(parsed)
+        # Skip test should be skipped
+        skip_results = by_test["test_pytest_skip"]
+        assert len(skip_results) == 1
+        assert skip_results[0]["outcome"] == "skipped"
 
-            # Skip test should be skipped
-            skip_results = [r for r in results if r["nodeid"].endswith("::test_pytest_skip")]
-            assert len(skip_results) == 1
-            assert skip_results[0]["outcome"] == "skipped"
-
-            # Should emit deprecation warning with exact message
-            expected_warning = SKIP_DEPRECATION_MSG.format(func_name="test_pytest_skip")
-            assert expected_warning in result.stderr
+        # Should emit deprecation warning with exact message
+        expected_warning = SKIP_DEPRECATION_MSG.format(func_name="test_pytest_skip")
+        assert expected_warning in stderr
 
 
 class TestPythonFilesConfiguration:
@@ -590,12 +759,7 @@ class TestPythonFilesConfiguration:
             (tmp_path / "user_spec.py").write_text("def test_two(): assert True\n")
             (tmp_path / "test_standard.py").write_text("def test_three(): assert True\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             assert "Running 2 test file(s)" in result.stdout
@@ -609,12 +773,7 @@ class TestPythonFilesConfiguration:
             (tmp_path / "example_test.py").write_text("def test_suffix(): assert True\n")
             (tmp_path / "check_other.py").write_text("def test_nonstandard(): assert True\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             assert "Running 2 test file(s)" in result.stdout
@@ -641,12 +800,7 @@ class TestPythonClassesConfiguration:
                 "    def test_three(self): assert True\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             # Should find CheckValidation and UserSuite, but NOT TestStandard
@@ -664,12 +818,7 @@ class TestPythonClassesConfiguration:
                 "    def test_two(self): assert True\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             # Should only find TestValid with default Test* pattern
@@ -694,12 +843,7 @@ class TestPythonClassesConfiguration:
                 "    def test_four(self): assert True\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             # Should match MyTestCase, TestStandard, SuiteTestRunner but NOT NoMatch
@@ -723,12 +867,7 @@ class TestPythonFunctionsConfiguration:
                 "def test_standard(): assert True\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             assert "2 passed" in result.stdout
@@ -740,12 +879,7 @@ class TestPythonFunctionsConfiguration:
             test_file = tmp_path / "test_default.py"
             test_file.write_text("def test_valid(): assert True\n\ndef check_invalid(): assert True\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             assert "1 passed" in result.stdout
@@ -765,12 +899,7 @@ class TestPythonFunctionsConfiguration:
                 "    def test_three(self): assert True\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
 
             assert result.returncode == ExitCodeValues.OK
             assert "2 passed" in result.stdout
@@ -794,11 +923,6 @@ class TestSysPathBehavior:
                 "from helper_module import helper_func\n\ndef test_import_works():\n    assert helper_func() == 42\n"
             )
 
-            result = subprocess.run(
-                [sys.executable, "-m", "rtest", "--runner", "native", "-n", "1"],
-                capture_output=True,
-                text=True,
-                cwd=str(tmp_path),
-            )
+            result = _rtest_cli(["-n", "1"], tmp_path)
             assert result.returncode == ExitCodeValues.OK
             assert "1 passed" in result.stdout
@@ -54,11 +54,21 @@ class TestRaisesMatch:
         with rtest.raises(ValueError, match="Invalid regex pattern"):
             raises(ValueError, match="[invalid")
 
+    def test_repeated_pattern_reuses_compiled(self) -> None:
+        first = RaisesContext(ValueError, match=r"value \d+")
+        second = RaisesContext(ValueError, match=r"value \d+")
+        assert first._compiled is second._compiled
+
     def test_compiled_pattern(self) -> None:
         pattern = re.compile(r"bo+m")
         with rtest.raises(ValueError, match=pattern):
             raise ValueError("boom")
 
+    def test_compiled_pattern_used_directly(self) -> None:
+        pattern = re.compile(r"bo+m", re.IGNORECASE)
+        ctx = RaisesContext(ValueError, match=pattern)
+        assert ctx._compiled is pattern
+
 
 class TestRaisesExceptionTypes:
     def test_tuple_of_exceptions(self) -> None: